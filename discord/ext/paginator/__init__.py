@@ -2,4 +2,8 @@ from .buttons import *
 from .pages import *
 from .paginator import *
 
-__version__ = '0.0.1-a'
+try:
+    # written by hatch-vcs at build time; absent on raw checkouts
+    from ._version import __version__
+except ImportError:
+    __version__ = '0.0.0+unknown'
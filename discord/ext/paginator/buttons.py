@@ -164,7 +164,8 @@ class PaginatorMenu(discord.ui.Select):
         for page_group in self.page_groups:
             if selection == page_group.label:
                 return await self.paginator.update(
-                    pages=page_group.pages,
+                    # Converted once per group and cached on the paginator
+                    pages=self.paginator.get_page_group_content(page_group),
                     show_disabled=page_group.show_disabled,
                     show_indicator=page_group.show_indicator,
                     author_check=page_group.author_check,
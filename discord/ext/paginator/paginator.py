@@ -1,6 +1,7 @@
 from __future__ import annotations
+import asyncio
 from collections.abc import Mapping
-from typing import overload, TYPE_CHECKING
+from typing import Final, overload, TYPE_CHECKING
 
 import discord
 
@@ -17,6 +18,102 @@ __all__ = ("Paginator",)
 
 # TODO: Try to use EAFP style
 
+# Module-level bindings for attributes the hot paths load repeatedly; a
+# LOAD_GLOBAL on these specializes better than the discord.X attribute walk.
+_MISSING: Final = discord.MISSING
+_Embed: Final = discord.Embed
+_File: Final = discord.File
+
+# Keyword templates for the default navigation buttons. The row is the only
+# per-paginator piece, so everything else is built once at import time.
+_DEFAULT_BUTTON_SPECS: tuple[dict, ...] = (
+    {
+        "button_type": PaginatorButtonType.first,
+        "label": "<<",
+        "style": discord.ButtonStyle.blurple,
+    },
+    {
+        "button_type": PaginatorButtonType.prev,
+        "label": "<",
+        "style": discord.ButtonStyle.red,
+        "loop_label": "↪",
+    },
+    {
+        "button_type": PaginatorButtonType.page_indicator,
+        "style": discord.ButtonStyle.gray,
+        "disabled": True,
+    },
+    {
+        "button_type": PaginatorButtonType.next,
+        "label": ">",
+        "style": discord.ButtonStyle.green,
+        "loop_label": "↩",
+    },
+    {
+        "button_type": PaginatorButtonType.last,
+        "label": ">>",
+        "style": discord.ButtonStyle.blurple,
+    },
+)
+
+# O(1) dispatch for the common page types, keyed on the exact type.
+# Subclasses miss here and fall through to the isinstance path in
+# Paginator.get_page_content.
+_PAGE_FACTORIES = {
+    Page: lambda page: page,
+    str: lambda page: Page(content=page, embeds=[], files=[]),
+    discord.Embed: lambda page: Page(content=None, embeds=[page], files=[]),
+    discord.File: lambda page: Page(content=None, embeds=[], files=[page]),
+}
+
+# Same trick for the objects edit/respond hand back. A handler may return the
+# message directly or a coroutine resolving to it; subclasses miss the exact-
+# type lookup and fall through to an isinstance scan over the table.
+_RESPOND_RESULT_HANDLERS = {
+    discord.Message: lambda msg: msg,
+    discord.WebhookMessage: lambda msg: msg,
+    # Component/modal interactions already carry their message; only fetch
+    # original_response() when they don't, saving a round trip.
+    discord.Interaction: lambda msg: msg.message or msg.original_response(),
+}
+
+# interaction.response.edit_message returns None (it can only be used from a
+# component or modal, both of which carry the message), and so does an in-place
+# discord.Message edit; recover the edited message from the target instead.
+_EDIT_FALLBACK_HANDLERS = {
+    discord.Interaction: lambda message: message.message,
+    discord.Message: lambda message: message,
+}
+
+# Keyword arguments Paginator.edit forwards to Message.edit. Checked before
+# the request goes out so a typo fails fast instead of costing a round trip.
+_EDIT_ALLOWED = frozenset(
+    {
+        "content",
+        "embed",
+        "embeds",
+        "file",
+        "files",
+        "attachments",
+        "suppress",
+        "delete_after",
+        "allowed_mentions",
+        "view",
+    }
+)
+
+
+def _dispatch_result(table, obj):
+    """Looks up ``obj`` in a type-keyed handler table, trying the exact type
+    first and isinstance against each key as the subclass fallback.
+    """
+    if (handler := table.get(type(obj))) is not None:
+        return handler
+    for base, handler in table.items():
+        if isinstance(obj, base):
+            return handler
+    return None
+
 
 class Paginator(discord.ui.View, Mapping):
     """Creates a paginator which can be sent as a message and uses buttons for navigation.
@@ -60,6 +157,9 @@ class Paginator(discord.ui.View, Mapping):
         Has no effect if no callback exists for a `Page`.
     users: Optional[Set[Union[:class:`~discord.User`, :class:`~discord.Member`]]]
         The users or members that can invoke the paginator.
+    edit_debounce: :class:`float`
+        Seconds to wait before applying an :meth:`edit`, coalescing rapid
+        successive calls into one request. Defaults to ``0`` (no debounce).
 
     Attributes
     ----------
@@ -82,6 +182,51 @@ class Paginator(discord.ui.View, Mapping):
         The message the paginator is attached to.
     """
 
+    # discord.ui.View itself is not slotted, so instances keep a __dict__;
+    # declaring our attributes here still turns their access into fixed-offset
+    # slot loads, which is what the hot navigation path mostly does.
+    __slots__ = (
+        "timeout",
+        "pages",
+        "current_page",
+        "page_count",
+        "page_groups",
+        "default_page_group",
+        "buttons",
+        "custom_buttons",
+        "menu",
+        "show_menu",
+        "menu_placeholder",
+        "show_disabled",
+        "show_indicator",
+        "disable_on_timeout",
+        "use_default_buttons",
+        "default_button_row",
+        "loop_pages",
+        "custom_view",
+        "trigger_on_display",
+        "message",
+        "edit_debounce",
+        "_pending_edit",
+        "usercheck",
+        "users",
+        "_user_ids",
+        "_prepared_cache",
+        "_prepared_key",
+        "_page_cache",
+        "_embed_hash_cache",
+        "_group_cache",
+        "_shown_items",
+        "_view_dirty",
+        "_pending_goto",
+        "_goto_task",
+        "_last_had_files",
+        "_last_payload_hash",
+        "_has_files",
+        "_ephemeral_capable",
+        "_applied_custom_view",
+    )
+
     def __init__(
         self,
         pages: (
@@ -105,9 +250,11 @@ class Paginator(discord.ui.View, Mapping):
         custom_buttons: list[PaginatorButton] | None = None,
         trigger_on_display: bool | None = None,
         users: set[discord.User | discord.Member] | None = None,
+        edit_debounce: float = 0.0,
     ) -> None:
         super().__init__(timeout=timeout)
         self.timeout: float | None = timeout
+        self._ephemeral_capable: bool = timeout is not None and timeout < 900
         self.pages: (
             list[str]
             | list[Page]
@@ -116,33 +263,34 @@ class Paginator(discord.ui.View, Mapping):
             | list[PageGroup]
         ) = pages
         self.current_page = 0
+        self._prepared_cache: dict | None = None
+        self._prepared_key: tuple | None = None
+        self._page_cache: dict[int, Page] = {}
+        self._embed_hash_cache: dict[int, tuple[str, ...]] = {}
+        self._group_cache: dict[int, list[Page]] = {}
+        self._shown_items: list[PaginatorButton] = []
+        self._view_dirty: bool = True
+        self._pending_goto: tuple[int, discord.Interaction | None] | None = None
+        self._goto_task: asyncio.Task | None = None
+        self.edit_debounce = edit_debounce
+        self._pending_edit: asyncio.Task | None = None
+        self._last_had_files: bool = False
+        self._last_payload_hash: int | None = None
+        self._applied_custom_view: discord.ui.View | None = None
         self.menu: PaginatorMenu | None = None
         self.show_menu = show_menu
         self.menu_placeholder = menu_placeholder
         self.page_groups: list[PageGroup] | None = None
         self.default_page_group: int = 0
 
-        all_groups = True
-        default_group = None
-
-        for pg in self.pages:
-            if not isinstance(pg, PageGroup):
-                all_groups = False
-                break
-
-            if pg.default:
-                if default_group is not None:
-                    raise ValueError("Only one PageGroup can be set as the default.")
-                default_group = pg
-
-        if all_groups:
-            default_group = default_group or 0
-            self.page_groups = self.pages if show_menu else []  # type: ignore # all_groups is True, so self.page_groups is a list[PageGroup]
-            self.default_page_group = default_group  # self.page_groups[default_group]
-            self.pages: list[Page] = self.get_page_group_content(
-                self.page_groups[self.default_page_group]
-            )
+        default_idx = self._resolve_page_groups(self.pages)
+        if default_idx is not None:
+            groups: list[PageGroup] = self.pages  # type: ignore # every entry is a PageGroup
+            self.page_groups = groups if show_menu else []
+            self.default_page_group = default_idx
+            self.pages = self.get_page_group_content(groups[default_idx])
 
+        self._has_files: bool = self._pages_have_files(self.pages)
         self.page_count = max(len(self.pages) - 1, 0)
         self.buttons: dict[PaginatorButtonType, PaginatorButton] = {}
         self.custom_buttons: list[PaginatorButton] | None = custom_buttons
@@ -167,6 +315,9 @@ class Paginator(discord.ui.View, Mapping):
 
         self.usercheck = author_check
         self.users = users
+        self._user_ids: frozenset[int] = (
+            frozenset(user.id for user in users) if users else frozenset()
+        )
 
     # In order to support the Mapping protocol, we need to implement these 3 methods
     # This allows us to unpack paginator in the kwargs of a send function. Example:
@@ -253,32 +404,25 @@ class Paginator(discord.ui.View, Mapping):
         """
 
         # Update pages and reset current_page to 0 (default)
+        self._invalidate_prepared()
+        if pages is not None:
+            self._page_cache.clear()
+            self._embed_hash_cache.clear()
         self.pages = pages or self.pages
         self.show_menu = show_menu if show_menu is not None else self.show_menu
 
         if pages is not None:
-
-            all_groups = True
-            default_group: PageGroup | None = None
-
-            for pg in pages:
-                if not isinstance(pg, PageGroup):
-                    all_groups = False
-                    break
-
-                if pg.default:
-                    if default_group is not None:
-                        raise ValueError(
-                            "Only one PageGroup can be set as the default."
-                        )
-                    default_group = pg
-
-            if all_groups:
-                self.page_groups = self.pages if show_menu else []  # type: ignore # all_groups is True, so self.page_groups is a list[PageGroup]
-                self.default_page_group = self.page_groups.index(default_group)
-                self.pages: list[Page] = self.get_page_group_content(
-                    self.page_groups[self.default_page_group]
+            default_idx = self._resolve_page_groups(pages)
+            if default_idx is not None:
+                groups: list[PageGroup] = pages  # type: ignore # every entry is a PageGroup
+                self.page_groups = groups if self.show_menu else []
+                self.default_page_group = default_idx
+                self.pages = self.get_page_group_content(
+                    groups[default_idx]
                 )
+                # Page groups changed; rebuild the menu on next use
+                self.menu = None
+            self._has_files = self._pages_have_files(self.pages)
 
         self.page_count = max(len(self.pages) - 1, 0)
         self.current_page = current_page if current_page <= self.page_count else 0
@@ -291,6 +435,8 @@ class Paginator(discord.ui.View, Mapping):
             self.usercheck = author_check
         if menu_placeholder is not None:
             self.menu_placeholder = menu_placeholder
+            # Placeholder changed; rebuild the menu on next use
+            self.menu = None
         if disable_on_timeout is not None:
             self.disable_on_timeout = disable_on_timeout
         if use_default_buttons is not None:
@@ -299,14 +445,20 @@ class Paginator(discord.ui.View, Mapping):
             self.default_button_row = default_button_row
         if loop_pages is not None:
             self.loop_pages = loop_pages
-        if custom_view is not None:
+        if custom_view is not discord.MISSING:
             self.custom_view = custom_view
+            # Force a full button rebuild so the new view's items get added
+            self._view_dirty = True
         if timeout is not discord.MISSING:
             self.timeout = timeout
+            self._ephemeral_capable = timeout is not None and timeout < 900
         if trigger_on_display is not None:
             self.trigger_on_display = trigger_on_display
         if users is not discord.MISSING:
             self.users = users
+            self._user_ids = (
+                frozenset(user.id for user in users) if users else frozenset()
+            )
         if custom_buttons is not discord.MISSING:
             self.custom_buttons = custom_buttons
 
@@ -326,8 +478,7 @@ class Paginator(discord.ui.View, Mapping):
         if self.disable_on_timeout:
             for item in self.children:
                 item.disabled = True
-            page = self.pages[self.current_page]
-            page = self.get_page_content(page)
+            page = self._resolve(self.current_page)
             files = page.update_files()
             try:
                 await self.message.edit(
@@ -354,12 +505,13 @@ class Paginator(discord.ui.View, Mapping):
             The page content to show after disabling the paginator.
         """
         page = self.get_page_content(page)
+        custom_ids = (
+            frozenset(map(id, self.custom_view.children))
+            if self.custom_view and not include_custom
+            else frozenset()
+        )
         for item in self.children:
-            if (
-                include_custom
-                or not self.custom_view
-                or item not in self.custom_view.children
-            ):
+            if id(item) not in custom_ids:
                 item.disabled = True
         if page:
             await self.message.edit(
@@ -384,15 +536,19 @@ class Paginator(discord.ui.View, Mapping):
         page: Optional[Union[:class:`str`, Union[List[:class:`discord.Embed`], :class:`discord.Embed`]]]
             The page content to show after canceling the paginator.
         """
-        items = self.children.copy()
         page = self.get_page_content(page)
-        for item in items:
-            if (
-                include_custom
-                or not self.custom_view
-                or item not in self.custom_view.children
-            ):
+        custom_ids = (
+            frozenset(map(id, self.custom_view.children))
+            if self.custom_view and not include_custom
+            else frozenset()
+        )
+        for item in list(self.children):
+            if id(item) not in custom_ids:
                 self.remove_item(item)
+        self._shown_items = []
+        self._view_dirty = True
+        if include_custom:
+            self._applied_custom_view = None
         if page:
             await self.message.edit(
                 content=page.content,
@@ -402,24 +558,90 @@ class Paginator(discord.ui.View, Mapping):
         else:
             await self.message.edit(view=self)
 
+    def to_kwargs(self, update_files: bool = False) -> dict:
+        """Returns the keyword arguments for displaying the current page,
+        suitable for unpacking into a send or edit call. Unlike iterating the
+        paginator as a mapping, this prepares the payload exactly once.
+
+        Parameters
+        ----------
+        update_files: :class:`bool`
+            Whether to refresh the current page's :class:`discord.File`
+            objects so they can be sent again.
+        """
+        return self._prepare(update_files)
+
+    def _payload_hash(self, page: dict) -> int:
+        """A cheap structural hash of a prepared payload, used to detect edits
+        that would not change the message at all.
+
+        Serializing the embeds dominates the cost, so that part is memoized
+        per page index; toggling back and forth between pages reuses it.
+        """
+        embeds = self._embed_hash_cache.get(self.current_page)
+        if embeds is None:
+            embeds = tuple(str(e.to_dict()) for e in page.get("embeds") or [])
+            if len(self._embed_hash_cache) >= 32:
+                self._embed_hash_cache.clear()
+            self._embed_hash_cache[self.current_page] = embeds
+        return hash(
+            (
+                self.current_page,
+                page.get("content"),
+                embeds,
+                bool(page.get("files")),
+            )
+        )
+
+    def _invalidate_prepared(self) -> None:
+        """Drops the cached :meth:`_prepare` result so the next access rebuilds it."""
+        self._prepared_cache = None
+        self._prepared_key = None
+
     def _prepare(self, update_files: bool = False):
-        """Prepares the paginator for sending by updating the display state of the buttons."""
+        """Prepares the paginator for sending by updating the display state of the buttons.
+
+        The result is cached until the page or the button layout changes, so unpacking
+        ``**paginator`` into a send call only does the full preparation work once.
+        """
+        key = (
+            self.current_page,
+            id(self.pages),
+            id(self.custom_view),
+            self.show_indicator,
+        )
+        if (
+            not update_files
+            and self._prepared_cache is not None
+            and self._prepared_key == key
+        ):
+            return self._prepared_cache.copy()
         self.update_buttons()
-        page = self.pages[self.current_page]
-        page_content = self.get_page_content(page)
+        page_content = self._resolve(self.current_page)
 
-        if page_content.custom_view:
-            self.update_custom_view(page_content.custom_view)
+        # A page-level custom view overrides the paginator-level one; when the
+        # page has none, fall back to (or restore) the paginator's own.
+        target_view = page_content.custom_view or self.custom_view
+        if target_view is not None or self._applied_custom_view is not None:
+            self.update_custom_view(target_view)
 
-        if update_files:
+        if update_files and page_content.files:
             page_content.update_files()
 
-        return {
+        data = {
             "content": page_content.content,
             "embeds": page_content.embeds,
-            "files": page_content.files,
             "view": self,
         }
+        # Text/embed-only paginators omit the files kwarg entirely, letting
+        # discord's send/edit paths skip their multipart branch.
+        if self._has_files:
+            data["files"] = page_content.files
+        self._prepared_cache = data
+        self._prepared_key = key
+        # Hand out copies so callers can splice their own kwargs in without
+        # poisoning the cache.
+        return data.copy()
 
     async def goto_page(
         self, page_number: int = 0, *, interaction: discord.Interaction | None = None
@@ -445,75 +667,89 @@ class Paginator(discord.ui.View, Mapping):
         :class:`~discord.Message`
             The message associated with the paginator.
         """
+        self._invalidate_prepared()
         self.current_page = page_number
-        data = self._prepare(True)
-
-        if interaction:
-            # await interaction.response.defer()  # needed to force webhook message edit route for files kwarg support # TODO: Check if this is still needed
-            await interaction.response.edit_message(
-                # message_id=self.message.id,
-                **data,
-                attachments=[],
-            )
-        else:
-            await self.message.edit(
-                **data,
-                attachments=[],
-            )
-        if self.trigger_on_display:
-            await self.page_action(interaction=interaction)
+
+        # Coalesce rapid navigations: while an edit is in flight, only record
+        # the newest target and let the running worker pick it up, so mashing
+        # next/prev costs one API call per burst instead of one per click.
+        superseded = self._pending_goto
+        self._pending_goto = (page_number, interaction)
+        if self._goto_task is not None and not self._goto_task.done():
+            if superseded and superseded[1] and not superseded[1].response.is_done():
+                # Acknowledge the click whose target was just overwritten.
+                await superseded[1].response.defer()
+            return
+        self._goto_task = asyncio.create_task(self._process_goto())
+        await self._goto_task
+
+    async def _process_goto(self) -> None:
+        """Drains pending :meth:`goto_page` targets, editing the message once
+        per target and picking up any navigation that arrived mid-edit.
+        """
+        while (pending := self._pending_goto) is not None:
+            self._pending_goto = None
+            page_number, interaction = pending
+            self.current_page = page_number
+
+            has_files = bool(self._resolve(page_number).files)
+            if interaction and has_files and not interaction.response.is_done():
+                # The UPDATE_MESSAGE callback can't carry file uploads, so
+                # acknowledge first (stopping the ~3s clock before the slow
+                # file I/O) and edit through the webhook followup below.
+                await interaction.response.defer()
+
+            data = self.to_kwargs(update_files=True)
+
+            # Only clear attachments when this page or the previous one
+            # actually carried files; otherwise skip the multipart machinery.
+            attachments = [] if has_files or self._last_had_files else _MISSING
+            self._last_had_files = has_files
+            self._last_payload_hash = self._payload_hash(data)
+
+            if interaction is None:
+                await self.message.edit(
+                    **data,
+                    attachments=attachments,
+                )
+            elif interaction.response.is_done():
+                await interaction.followup.edit_message(
+                    message_id=self.message.id,
+                    **data,
+                    attachments=attachments,
+                )
+            else:
+                # UPDATE_MESSAGE edits and acknowledges in one round trip.
+                await interaction.response.edit_message(
+                    **data,
+                    attachments=attachments,
+                )
+            if self.trigger_on_display:
+                await self.page_action(interaction=interaction)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if self.usercheck:
-            return interaction.user in self.users
-        return True
+        # Hash the snowflake instead of comparing User objects; this fires on
+        # every component click.
+        return not self.usercheck or interaction.user.id in self._user_ids
 
     def add_menu(self):
-        """Adds the default :class:`PaginatorMenu` instance to the paginator."""
-        self.menu = PaginatorMenu(self.page_groups, placeholder=self.menu_placeholder)
-        self.menu.paginator = self
-        self.add_item(self.menu)
+        """Adds the default :class:`PaginatorMenu` instance to the paginator,
+        constructing it on first use and reusing it afterwards.
+        """
+        if self.menu is None:
+            self.menu = PaginatorMenu(
+                self.page_groups, placeholder=self.menu_placeholder
+            )
+            self.menu.paginator = self
+        if not any(child is self.menu for child in self.children):
+            self.add_item(self.menu)
 
     def add_default_buttons(self):
         """Adds the full list of default buttons that can be used with the paginator.
         Includes ``first``, ``prev``, ``page_indicator``, ``next``, and ``last``.
         """
-        default_buttons = [
-            PaginatorButton(
-                PaginatorButtonType.first,
-                label="<<",
-                style=discord.ButtonStyle.blurple,
-                row=self.default_button_row,
-            ),
-            PaginatorButton(
-                PaginatorButtonType.prev,
-                label="<",
-                style=discord.ButtonStyle.red,
-                loop_label="↪",
-                row=self.default_button_row,
-            ),
-            PaginatorButton(
-                PaginatorButtonType.page_indicator,
-                style=discord.ButtonStyle.gray,
-                disabled=True,
-                row=self.default_button_row,
-            ),
-            PaginatorButton(
-                PaginatorButtonType.next,
-                label=">",
-                style=discord.ButtonStyle.green,
-                loop_label="↩",
-                row=self.default_button_row,
-            ),
-            PaginatorButton(
-                PaginatorButtonType.last,
-                label=">>",
-                style=discord.ButtonStyle.blurple,
-                row=self.default_button_row,
-            ),
-        ]
-        for button in default_buttons:
-            self.add_button(button)
+        for spec in _DEFAULT_BUTTON_SPECS:
+            self.add_button(PaginatorButton(**spec, row=self.default_button_row))
 
     def add_button(self, button: PaginatorButton):
         """Adds a :class:`PaginatorButton` to the paginator."""
@@ -525,14 +761,17 @@ class Paginator(discord.ui.View, Mapping):
         button.paginator = self
 
         self.buttons[button.button_type] = button
+        self._view_dirty = True
 
     def remove_button(self, button_type: PaginatorButtonType):
         """Removes a buton of type :class:`PaginatorButtonType` from the paginator."""
-        if button_type not in self.buttons.keys():
+        try:
+            self._view_dirty = True
+            return self.buttons.pop(button_type)
+        except KeyError:
             raise ValueError(
                 f"no button_type {button_type} was found in this paginator."
-            )
-        return self.buttons.pop(button_type)
+            ) from None
 
     def update_buttons(self) -> dict:
         """Updates the display state of the buttons (disabled/hidden)
@@ -542,14 +781,14 @@ class Paginator(discord.ui.View, Mapping):
         Dict[:class:`str`, Dict[:class:`str`, Union[:class:`~PaginatorButton`, :class:`bool`]]]
             The dictionary of buttons that were updated.
         """
+        self._invalidate_prepared()
+        btns = self.buttons
 
-        if (first := self.buttons.get(PaginatorButtonType.first, None)) is not None:
+        if (first := btns.get(PaginatorButtonType.first, None)) is not None:
             first.hidden = self.current_page <= 1
-        if (last := self.buttons.get(PaginatorButtonType.last, None)) is not None:
+        if (last := btns.get(PaginatorButtonType.last, None)) is not None:
             last.hidden = self.current_page >= self.page_count - 1
-        if (
-            next_button := self.buttons.get(PaginatorButtonType.next, None)
-        ) is not None:
+        if (next_button := btns.get(PaginatorButtonType.next, None)) is not None:
             if self.current_page == self.page_count:
                 if not self.loop_pages:
                     next_button.hidden = True
@@ -560,9 +799,7 @@ class Paginator(discord.ui.View, Mapping):
                 next_button.hidden = False
                 next_button.label = next_button.base_label
 
-        if (
-            prev_button := self.buttons.get(PaginatorButtonType.prev, None)
-        ) is not None:
+        if (prev_button := btns.get(PaginatorButtonType.prev, None)) is not None:
             if self.current_page <= 0:
                 if not self.loop_pages:
                     prev_button.hidden = True
@@ -573,24 +810,38 @@ class Paginator(discord.ui.View, Mapping):
                 prev_button.hidden = False
                 prev_button.label = prev_button.base_label
 
-        self.clear_items()
-
         if self.show_indicator:
-            self.buttons.get(
+            btns.get(
                 PaginatorButtonType.page_indicator
             ).label = f"{self.current_page + 1}/{self.page_count + 1}"
 
-        for key, button in self.buttons.items():
+        desired: list[PaginatorButton] = []
+        for key, button in btns.items():
             if key != PaginatorButtonType.page_indicator:
-                if button.hidden:
-                    button.disabled = True
-                    if self.show_disabled:
-                        self.add_item(button)
-                else:
-                    button.disabled = False
-                    self.add_item(button)
+                button.disabled = button.hidden
+                if self.show_disabled or not button.hidden:
+                    desired.append(button)
             elif self.show_indicator:
-                self.add_item(button)
+                desired.append(button)
+
+        menu_shown = self.menu is not None and any(
+            child is self.menu for child in self.children
+        )
+        if (
+            not self._view_dirty
+            and desired == self._shown_items
+            and self.show_menu == menu_shown
+        ):
+            # View isn't dirty and membership didn't change; the disabled and
+            # label updates above were applied to the shown buttons in place,
+            # so the usual clear_items/add_item churn can be skipped entirely.
+            return self.buttons
+
+        self.clear_items()
+        self._applied_custom_view = None
+        for button in desired:
+            self.add_item(button)
+        self._shown_items = desired
 
         if self.show_menu:
             self.add_menu()
@@ -600,45 +851,135 @@ class Paginator(discord.ui.View, Mapping):
         if self.custom_view:
             self.update_custom_view(self.custom_view)
 
+        self._view_dirty = False
         return self.buttons
 
-    def update_custom_view(self, custom_view: discord.ui.View):
-        """Updates the custom view shown on the paginator."""
-        if isinstance(self.custom_view, discord.ui.View):
-            for item in self.custom_view.children:
+    def update_custom_view(self, custom_view: discord.ui.View | None):
+        """Updates the custom view shown on the paginator.
+
+        Reapplying the view that is already shown is a no-op, so pages that
+        share a custom view don't churn the item list on every navigation.
+        """
+        if custom_view is self._applied_custom_view:
+            return
+        self._invalidate_prepared()
+        if isinstance(self._applied_custom_view, discord.ui.View):
+            for item in self._applied_custom_view.children:
                 self.remove_item(item)
-        for item in custom_view.children:
-            self.add_item(item)
+        if custom_view is not None:
+            for item in custom_view.children:
+                self.add_item(item)
+        self._applied_custom_view = custom_view
+
+    @staticmethod
+    def _pages_have_files(
+        pages: (
+            list[Page]
+            | list[str]
+            | list[list[discord.Embed]]
+            | list[discord.Embed]
+            | list[PageGroup]
+        ),
+    ) -> bool:
+        """Whether any page in the list can carry file uploads."""
+        for page in pages:
+            if isinstance(page, discord.File):
+                return True
+            if isinstance(page, Page) and page.files:
+                return True
+            if isinstance(page, list) and page and isinstance(page[0], discord.File):
+                return True
+        return False
+
+    @staticmethod
+    def _resolve_page_groups(
+        pages: (
+            list[Page]
+            | list[str]
+            | list[list[discord.Embed]]
+            | list[discord.Embed]
+            | list[PageGroup]
+        ),
+    ) -> int | None:
+        """Scans ``pages`` in a single pass. Returns the index of the default
+        :class:`PageGroup` (``0`` if none is marked) when every entry is a
+        ``PageGroup``, and ``None`` otherwise.
+
+        Raises
+        ------
+        ValueError
+            More than one ``PageGroup`` was set as the default.
+        """
+        default_idx = -1
+        for i, pg in enumerate(pages):
+            if type(pg) is not PageGroup:
+                return None
+            if pg.default:
+                if default_idx >= 0:
+                    raise ValueError("Only one PageGroup can be set as the default.")
+                default_idx = i
+        return max(default_idx, 0)
+
+    def _resolve(self, page_number: int) -> Page:
+        """Returns the converted :class:`Page` for the given page number,
+        converting and caching it on first access.
+        """
+        page = self._page_cache.get(page_number)
+        if page is None:
+            page = self.get_page_content(self.pages[page_number])
+            self._page_cache[page_number] = page
+        return page
 
     def get_page_group_content(self, page_group: PageGroup) -> list[Page]:
-        """Returns a converted list of `Page` objects for the given page group based on the content of its pages."""
-        return [self.get_page_content(page) for page in page_group.pages]
+        """Returns a converted list of `Page` objects for the given page group based on the content of its pages.
+
+        The conversion is cached per group, so revisiting a group through the
+        menu does not redo it.
+        """
+        content = self._group_cache.get(id(page_group))
+        if content is None:
+            content = [self.get_page_content(page) for page in page_group.pages]
+            self._group_cache[id(page_group)] = content
+        # The result becomes self.pages, so seed the page cache eagerly.
+        self._page_cache = dict(enumerate(content))
+        self._embed_hash_cache.clear()
+        return content
 
     @staticmethod
     def get_page_content(
         page: Page | str | discord.Embed | list[discord.Embed],
     ) -> Page:
         """Converts a page into a :class:`Page` object based on its content."""
+        if (factory := _PAGE_FACTORIES.get(type(page))) is not None:
+            return factory(page)
+        if isinstance(page, list):
+            # Pick the embed or file path from the first element and validate
+            # with exact-type pointer compares; lists of subclassed embeds or
+            # files are rare and drop to the isinstance scans below.
+            first_type = type(page[0]) if page else _Embed
+            if first_type is _Embed and all(type(x) is _Embed for x in page):
+                return Page(content=None, embeds=page, files=[])
+            if first_type is _File and all(type(x) is _File for x in page):
+                return Page(content=None, embeds=[], files=page)
+            if all(isinstance(x, discord.Embed) for x in page):
+                return Page(content=None, embeds=page, files=[])
+            if all(isinstance(x, discord.File) for x in page):
+                return Page(content=None, embeds=[], files=page)
+            raise TypeError("All list items must be embeds or files.")
+        # Subclasses of the supported types miss the factory dict; keep the
+        # slower isinstance checks for them.
         if isinstance(page, Page):
             return page
-        elif isinstance(page, str):
+        if isinstance(page, str):
             return Page(content=page, embeds=[], files=[])
-        elif isinstance(page, discord.Embed):
+        if isinstance(page, discord.Embed):
             return Page(content=None, embeds=[page], files=[])
-        elif isinstance(page, discord.File):
+        if isinstance(page, discord.File):
             return Page(content=None, embeds=[], files=[page])
-        elif isinstance(page, list):
-            if all(isinstance(x, discord.Embed) for x in page):
-                return Page(content=None, embeds=page, files=[])
-            if all(isinstance(x, discord.File) for x in page):
-                return Page(content=None, embeds=[], files=page)
-            else:
-                raise TypeError("All list items must be embeds or files.")
-        else:
-            raise TypeError(
-                "Page content must be a Page object, string, an embed, a list of"
-                " embeds, a file, or a list of files."
-            )
+        raise TypeError(
+            "Page content must be a Page object, string, an embed, a list of"
+            " embeds, a file, or a list of files."
+        )
 
     async def page_action(self, interaction: discord.Interaction | None = None) -> None:
         """Triggers the callback associated with the current page, if any.
@@ -648,10 +989,9 @@ class Paginator(discord.ui.View, Mapping):
         interaction: Optional[:class:`discord.Interaction`]
             The interaction that was used to trigger the page action.
         """
-        if self.get_page_content(self.pages[self.current_page]).callback:
-            await self.get_page_content(self.pages[self.current_page]).callback(
-                interaction=interaction
-            )
+        page = self._resolve(self.current_page)
+        if page.callback:
+            await page.callback(interaction=interaction)
 
     async def send(
         self,
@@ -673,7 +1013,9 @@ class Paginator(discord.ui.View, Mapping):
             The message that was sent with the paginator.
         """
 
-        page = self._prepare()
+        page = self.to_kwargs()
+        self._last_had_files = bool(page.get("files"))
+        self._last_payload_hash = self._payload_hash(page)
 
         self.message = await destination.send(
             **page,
@@ -735,27 +1077,70 @@ class Paginator(discord.ui.View, Mapping):
             The message that was edited. Returns ``None`` if the operation failed.
         """
 
-        page = self._prepare()
+        if kwargs and (bad := kwargs.keys() - _EDIT_ALLOWED):
+            raise TypeError(
+                f"edit() got unexpected keyword argument(s): {', '.join(sorted(bad))}"
+            )
 
-        # pyright thinks the return type of this method can't be assigned to Message attribute for some reason
-        self.message = await message.edit(  # type: ignore
-            **page,
-            attachments=[],
-            **kwargs,
-        )
-        if self.message is None:
-            if isinstance(message, discord.Interaction):
-                # if the message is None, it means that interaction.response.edit_message was used.
-                # this can only be done if the interaction was from a component or a modal (not a slash command)
-                # both of which have the message attribute set if you can use edit_message
-                self.message: discord.Message = message.message  # type: ignore
-            elif isinstance(
-                message, discord.Message
-            ):  # isinstance check was added to satisfy type checker. this is the only other case that might return None
-                # target was discord.Message, and edit was in-place
-                self.message: discord.Message = message
+        if self.edit_debounce > 0:
+            # Cancel any edit still waiting out the debounce window; only the
+            # latest state is worth sending.
+            if self._pending_edit is not None and not self._pending_edit.done():
+                self._pending_edit.cancel()
+            self._pending_edit = asyncio.create_task(
+                self._debounced_edit(message, kwargs)
+            )
+            try:
+                return await self._pending_edit
+            except asyncio.CancelledError:
+                # Superseded by a newer edit within the window.
+                return self.message
 
-        return self.message
+        return await self._edit_now(message, kwargs)
+
+    async def _debounced_edit(self, message, kwargs: dict):
+        """Waits out the debounce window, then performs the edit; cancelled
+        and replaced whenever another edit arrives in the meantime.
+        """
+        await asyncio.sleep(self.edit_debounce)
+        return await self._edit_now(message, kwargs)
+
+    async def _edit_now(self, message, kwargs: dict):
+        """Performs the actual edit for :meth:`edit` with already-validated kwargs."""
+        page = self.to_kwargs()
+
+        # Re-attaching an identical payload to the message we already manage
+        # would be a wasted round trip; bail out early.
+        payload_hash = self._payload_hash(page)
+        if (
+            not kwargs
+            and self.message is not None
+            and payload_hash == self._last_payload_hash
+            and getattr(message, "id", None) == self.message.id
+        ):
+            return self.message
+
+        has_files = bool(page.get("files"))
+
+        # to_kwargs hands out a fresh copy, so fold everything into it rather
+        # than re-merging dicts in the call. Clearing attachments only matters
+        # when the message has, or is about to get, file uploads; text-only
+        # paginators skip those payload bytes.
+        if has_files or self._last_had_files or getattr(message, "attachments", None):
+            page["attachments"] = []
+        self._last_had_files = has_files
+        self._last_payload_hash = payload_hash
+
+        if kwargs:
+            page.update(kwargs)
+        # pyright thinks the return type of this method can't be assigned to Message attribute for some reason
+        m = await message.edit(**page)  # type: ignore
+        if m is None and (
+            handler := _dispatch_result(_EDIT_FALLBACK_HANDLERS, message)
+        ):
+            m = handler(message)
+        self.message = m
+        return m
 
     async def respond(
         self,
@@ -790,25 +1175,22 @@ class Paginator(discord.ui.View, Mapping):
             The :class:`~discord.Message` or :class:`~discord.WebhookMessage` that was sent with the paginator.
         """
 
-        if ephemeral and (self.timeout is None or self.timeout >= 900):
+        if ephemeral and not self._ephemeral_capable:
             raise ValueError(
                 "paginator responses cannot be ephemeral if the paginator timeout is 15"
                 " minutes or greater"
             )
 
-        page = self._prepare()
+        page = self.to_kwargs()
+        self._last_had_files = bool(page.get("files"))
 
-        msg = await interaction.respond(
-            **page,
-            ephemeral=ephemeral,
-            **kwargs,
-        )
+        page["ephemeral"] = ephemeral
+        if kwargs:
+            page.update(kwargs)
+        msg = await interaction.respond(**page)
 
-        if isinstance(msg, (discord.Message, discord.WebhookMessage)):
-            self.message = msg
-        elif isinstance(msg, discord.Interaction):
-            self.message = (
-                await msg.original_response()
-            )  # TODO: Try avoid this and work with Interactions wherever possible
+        if (handler := _dispatch_result(_RESPOND_RESULT_HANDLERS, msg)) is not None:
+            result = handler(msg)
+            self.message = await result if asyncio.iscoroutine(result) else result
 
         return self.message